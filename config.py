@@ -5,92 +5,80 @@ This module contains environment configuration settings for the FastAPI backend
 Configuration can be managed through environment variables.
 """
 
-import os
 from typing import Optional
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """
     Application settings and configuration.
     
-    Settings are read from environment variables with the prefix specified.
+    Settings are read from environment variables (or the .env file) and
+    coerced to the annotated field types by pydantic-settings.
     """
     
+    # Immutable (and hashable) so the cached instance can be shared safely
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        populate_by_name=True,
+        frozen=True,
+    )
+    
     # Application Settings
-    app_name: str = os.getenv("APP_NAME", "Password Manager API")
-    app_version: str = os.getenv("APP_VERSION", "1.0.0")
-    debug: bool = os.getenv("DEBUG", "True").lower() == "true"
+    app_name: str = "Password Manager API"
+    app_version: str = "1.0.0"
+    debug: bool = True
     
     # Server Settings
-    host: str = os.getenv("SERVER_HOST", "0.0.0.0")
-    port: int = int(os.getenv("SERVER_PORT", "8000"))
+    host: str = Field("0.0.0.0", validation_alias="SERVER_HOST")
+    port: int = Field(8000, validation_alias="SERVER_PORT")
     
     # API Settings
-    api_prefix: str = os.getenv("API_PREFIX", "/api/v1")
-    allowed_origins: list = [
+    api_prefix: str = "/api/v1"
+    allowed_origins: tuple[str, ...] = (
         "http://localhost",
         "http://localhost:3000",
         "http://localhost:8000",
-    ]
+    )
     
     # Database Settings
-    database_url: str = os.getenv(
-        "DATABASE_URL",
-        "sqlite:///./test.db"
-    )
-    database_echo: bool = os.getenv("DATABASE_ECHO", "False").lower() == "true"
+    database_url: str = "sqlite:///./password_manager.db"
+    database_echo: bool = False
     
     # JWT Settings
-    secret_key: str = os.getenv(
-        "SECRET_KEY",
-        "your-secret-key-change-in-production"
-    )
-    algorithm: str = os.getenv("ALGORITHM", "HS256")
-    access_token_expire_minutes: int = int(
-        os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
-    )
-    refresh_token_expire_days: int = int(
-        os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")
-    )
+    secret_key: str = "your-secret-key-change-in-production"
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 7
     
     # Password Settings
-    password_min_length: int = int(os.getenv("PASSWORD_MIN_LENGTH", "8"))
-    password_require_uppercase: bool = (
-        os.getenv("PASSWORD_REQUIRE_UPPERCASE", "True").lower() == "true"
-    )
-    password_require_numbers: bool = (
-        os.getenv("PASSWORD_REQUIRE_NUMBERS", "True").lower() == "true"
-    )
-    password_require_special_chars: bool = (
-        os.getenv("PASSWORD_REQUIRE_SPECIAL_CHARS", "True").lower() == "true"
-    )
+    password_min_length: int = Field(8, ge=0)
+    password_require_uppercase: bool = True
+    password_require_numbers: bool = True
+    password_require_special_chars: bool = True
     
     # Email Settings
-    smtp_server: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    smtp_port: int = int(os.getenv("SMTP_PORT", "587"))
-    smtp_username: Optional[str] = os.getenv("SMTP_USERNAME")
-    smtp_password: Optional[str] = os.getenv("SMTP_PASSWORD")
-    smtp_from_email: str = os.getenv("SMTP_FROM_EMAIL", "noreply@passwordmanager.com")
+    smtp_server: str = "smtp.gmail.com"
+    smtp_port: int = 587
+    smtp_username: Optional[str] = None
+    smtp_password: Optional[str] = None
+    smtp_from_email: str = "noreply@passwordmanager.com"
     
     # Logging Settings
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    log_file: Optional[str] = os.getenv("LOG_FILE")
+    log_level: str = "INFO"
+    log_file: Optional[str] = None
     
     # Security Settings
-    cors_enabled: bool = os.getenv("CORS_ENABLED", "True").lower() == "true"
-    https_only: bool = os.getenv("HTTPS_ONLY", "False").lower() == "true"
+    cors_enabled: bool = True
+    https_only: bool = False
     
     # Rate Limiting
-    rate_limit_enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
-    rate_limit_requests: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
-    rate_limit_period_seconds: int = int(os.getenv("RATE_LIMIT_PERIOD_SECONDS", "60"))
-    
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        case_sensitive = False
+    rate_limit_enabled: bool = True
+    rate_limit_requests: int = 100
+    rate_limit_period_seconds: int = 60
     
     def is_production(self) -> bool:
         """Check if the application is running in production mode."""
@@ -112,16 +100,13 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Convenience function to get settings
-def load_config() -> Settings:
+def __getattr__(name: str) -> Settings:
     """
-    Load configuration settings.
+    Lazily expose the cached settings instance as ``config.settings``.
     
-    Returns:
-        Settings: Configuration settings object
+    Importing this module (e.g. only for the Settings type) does not read
+    the environment or .env file until settings is first accessed.
     """
-    return get_settings()
-
-
-# Export settings instance
-settings = get_settings()
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,44 +4,228 @@ This module provides database initialization, configuration, and session managem
 for the application using SQLAlchemy ORM.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
-import os
-from dotenv import load_dotenv
+import time
+from functools import lru_cache
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+from typing import AsyncGenerator, Callable, Generator
 
-# Load environment variables from .env file
-load_dotenv()
+from config import settings
 
 # Database URL configuration
-# Supports both SQLite (default) and other databases via DATABASE_URL env variable
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "sqlite:///./password_manager.db"
-)
+# Supports both SQLite (default) and other databases via DATABASE_URL env variable.
+# The .env file is read once by the cached Settings object in config.py.
+DATABASE_URL = settings.database_url
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """
+    Get the shared database engine.
+    The engine (and its connection pool) is created once per process.
+    
+    Returns:
+        Engine: SQLAlchemy engine bound to DATABASE_URL
+    """
+    engine = create_engine(
+        DATABASE_URL,
+        **_engine_kwargs(DATABASE_URL),
+        echo=settings.database_echo  # Set DATABASE_ECHO=True for SQL logging
+    )
+    
+    _register_engine_events(engine)
+    
+    return engine
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the shared asyncio database engine.
+    Uses the async driver for DATABASE_URL (aiosqlite / asyncpg) so
+    database waits do not tie up a worker thread.
+    For an in-memory SQLite URL this engine opens its own database, separate
+    from the sync engine's; create its tables with init_async_db().
+    
+    Returns:
+        AsyncEngine: SQLAlchemy asyncio engine
+    """
+    url = _async_url(DATABASE_URL)
+    engine = create_async_engine(
+        url,
+        **_engine_kwargs(url),
+        echo=settings.database_echo
+    )
+    
+    _register_engine_events(engine.sync_engine)
+    
+    return engine
+
+
+@lru_cache()
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get the shared AsyncSession factory bound to the asyncio engine.
+    
+    Returns:
+        async_sessionmaker: Factory producing AsyncSession objects
+    """
+    return async_sessionmaker(
+        get_async_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+# Async drivers substituted for a backend's sync (or default) DBAPI driver
+_ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+# Drivers that already provide an asyncio interface and are kept as-is
+_ASYNC_CAPABLE_DRIVERS = {"aiosqlite", "asyncpg", "psycopg", "aiomysql", "asyncmy"}
+
+
+def _async_url(database_url: str) -> str:
+    """
+    Return database_url rewritten to use an asyncio DBAPI driver.
+    A missing or sync driver (e.g. postgresql+psycopg2) is replaced by the
+    backend's async driver; explicitly named async-capable drivers are kept.
+    
+    Raises:
+        ValueError: If no async driver is known for the URL's backend
+    """
+    url = make_url(database_url)
+    explicit_driver = url.drivername.partition("+")[2]
+    if explicit_driver in _ASYNC_CAPABLE_DRIVERS:
+        return url.render_as_string(hide_password=False)
+    
+    backend = url.get_backend_name()
+    driver = _ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(
+            f"No async driver known for {backend!r} databases; set DATABASE_URL "
+            f"with an async driver, e.g. '{backend}+<async driver>://...'"
+        )
+    url = url.set(drivername=f"{backend}+{driver}")
+    return url.render_as_string(hide_password=False)
+
+
+def _engine_kwargs(database_url: str) -> dict:
+    """Build create_engine() keyword arguments for the given database URL."""
+    # For SQLite, we need to add check_same_thread=False for thread safety in development
+    engine_kwargs = {}
+    if database_url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if make_url(database_url).database in (None, "", ":memory:"):
+            # In-memory database: share one connection so data and the
+            # connect-time PRAGMAs persist across sessions
+            engine_kwargs["poolclass"] = StaticPool
+        else:
+            engine_kwargs["pool_size"] = 5
+    else:
+        engine_kwargs.update(
+            pool_size=20,
+            max_overflow=10,
+            pool_recycle=1800,
+        )
+    return engine_kwargs
+
+
+def _register_engine_events(engine: Engine) -> None:
+    """Attach connection hooks appropriate for the engine's dialect."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    else:
+        # SQLite connections are in-process and never go stale
+        event.listen(engine, "checkout", _make_ping_listener(engine.dialect.loaded_dbapi.Error))
+
+
+# Skip the checkout health check if the connection was verified this recently
+PING_INTERVAL_SECONDS = 1.0
+
+
+def _make_ping_listener(dbapi_error: type[Exception]) -> Callable[..., None]:
+    """
+    Build a "checkout" listener that verifies pooled connections are alive.
+    Replaces pool_pre_ping: the SELECT 1 round-trip is skipped when the same
+    connection was already checked within PING_INTERVAL_SECONDS.
+    
+    Args:
+        dbapi_error: The DBAPI module's Error class; only these errors mark
+            the connection as dead, anything else propagates unchanged
+    
+    Returns:
+        Callable: Listener for the pool "checkout" event
+    """
+    def _ping_connection(dbapi_connection, connection_record, connection_proxy) -> None:
+        now = time.monotonic()
+        if now - connection_record.info.get("last_ping", 0.0) < PING_INTERVAL_SECONDS:
+            return
+        
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except dbapi_error as exc:
+            # Makes the pool discard this connection and retry with a new one
+            raise DisconnectionError() from exc
+        connection_record.info["last_ping"] = now
+    
+    return _ping_connection
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune every new SQLite connection for concurrent access.
+    WAL lets readers proceed during writes, and synchronous=NORMAL avoids
+    an fsync on every commit (safe in WAL mode, may lose the last commit on power loss).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.close()
+
 
 # Create database engine
-# For SQLite, we need to add check_same_thread=False for thread safety in development
-engine_kwargs = {}
-if DATABASE_URL.startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
-
-engine = create_engine(
-    DATABASE_URL,
-    **engine_kwargs,
-    echo=os.getenv("SQL_ECHO", "False").lower() == "true"  # Set to True for SQL logging
-)
+engine = get_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,  # Avoid re-SELECTing attributes after commit
     bind=engine
 )
 
+# Shared metadata with deterministic constraint names (needed by Alembic batch mode)
+metadata = MetaData(naming_convention={
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+})
+
+
 # Declarative base for model definitions
-Base = declarative_base()
+class Base(DeclarativeBase):
+    metadata = metadata
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -62,21 +246,42 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async dependency for FastAPI to get database session.
+    Usage in FastAPI:
+        @app.get("/items/")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    
+    Yields:
+        AsyncSession: SQLAlchemy asyncio database session
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables based on defined models.
     Should be called once at application startup.
     """
-    Base.metadata.create_all(bind=engine)
+    import models  # noqa: F401  (registers model tables on Base.metadata)
+    
+    Base.metadata.create_all(bind=engine, checkfirst=True)
 
 
-def drop_db() -> None:
+async def init_async_db() -> None:
     """
-    Drop all tables from the database.
-    WARNING: This is destructive and will remove all data!
-    Use only in development/testing environments.
+    Create all tables through the asyncio engine.
+    Needed for in-memory SQLite, where the async engine does not share the
+    sync engine's database; for file or server databases init_db() suffices.
     """
-    Base.metadata.drop_all(bind=engine)
+    import models  # noqa: F401  (registers model tables on Base.metadata)
+    
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, checkfirst=True)
 
 
 def get_session() -> Session:
@@ -89,10 +294,3 @@ def get_session() -> Session:
     """
     return SessionLocal()
 
-
-# Example usage and testing
-if __name__ == "__main__":
-    # Initialize the database
-    init_db()
-    print(f"Database initialized successfully!")
-    print(f"Database URL: {DATABASE_URL}")
@@ -0,0 +1,56 @@
+"""
+Serialization DTOs for API Responses
+
+msgspec Structs mirroring the ORM models, for fast conversion of query
+results into JSON-ready builtins.
+"""
+
+from datetime import datetime
+from operator import attrgetter
+from typing import Iterable, Union
+
+import msgspec
+from sqlalchemy import Row
+
+from models import User
+
+
+class UserDTO(msgspec.Struct):
+    """Read-only view of a User as returned by the API"""
+
+    id: int
+    username: str
+    email: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+# Reads every UserDTO field from a User (or a matching Row) in one call
+_user_dto_get = attrgetter(*UserDTO.__struct_fields__)
+
+
+def user_to_dto(user: Union[User, Row]) -> UserDTO:
+    """
+    Build a UserDTO from a User entity or a row from list_users_fast
+
+    Args:
+        user: User entity or Row exposing the UserDTO fields as attributes
+
+    Returns:
+        UserDTO: Struct holding the user's public fields
+    """
+    return UserDTO(*_user_dto_get(user))
+
+
+def users_to_builtins(users: Iterable[Union[User, Row]]) -> list[dict]:
+    """
+    Convert users to JSON-ready builtins (dicts with ISO 8601 timestamps)
+
+    Args:
+        users: User entities or rows from list_users_fast
+
+    Returns:
+        list[dict]: One dict per user
+    """
+    return msgspec.to_builtins([user_to_dto(user) for user in users])
@@ -1,14 +1,64 @@
 """
 SQLAlchemy ORM Models for User Authentication System
+
+This is the single module that defines mapped classes. All models share the
+Base declared in database.py, so one metadata registry holds every table.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from typing import Sequence
+from operator import attrgetter
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from sqlalchemy import DateTime, Row, String, Index, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Mapped, Session, load_only, mapped_column
+from sqlalchemy.sql.expression import FunctionElement
+
+from database import Base
+
+__all__ = ["Base", "User", "list_users", "list_users_fast"]
+
+# Fields serialized by User.to_dict, fetched in one attrgetter call per row
+_USER_KEYS = ("id", "username", "email", "is_active", "created_at", "updated_at")
+_user_get = attrgetter(*_USER_KEYS)
+
+# Bound format method and getter for User.__repr__, built once at import
+_user_repr = "<User(id={}, username='{}', email='{}', is_active={})>".format
+_user_repr_get = attrgetter("id", "username", "email", "is_active")
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, evaluated by the database.
+    Matches the old datetime.utcnow defaults regardless of the server time zone.
+    """
+    type = DateTime()
+    inherit_cache = True
+
 
-# Create base class for all models
-Base = declarative_base()
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw):
+    return "UTC_TIMESTAMP(6)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is UTC but only has second precision
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+# Argon2id hasher with argon2-cffi's default cost parameters
+_password_hasher = PasswordHasher()
 
 
 class User(Base):
@@ -26,81 +76,92 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Matches the login filter (username = ? AND is_active = ?) so the
+        # is_active check is answered from the index. Not covering: the row is
+        # still read for hashed_password, and since username is already unique
+        # this mainly helps range/prefix scans over active usernames.
+        Index("ix_users_username_active", "username", "is_active"),
+    )
+    
+    __mapper_args__ = {
+        # Fetch server-generated timestamps on INSERT/UPDATE so they stay
+        # available on the instance (sessions use expire_on_commit=False)
+        "eager_defaults": True,
+    }
     
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, nullable=False, index=True)
-    email = Column(String(100), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255))
+    is_active: Mapped[bool] = mapped_column(default=True)
+    created_at: Mapped[datetime] = mapped_column(server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(server_default=utcnow(), onupdate=utcnow())
     
     def __repr__(self):
         """String representation of User object"""
-        return f"<User(id={self.id}, username='{self.username}', email='{self.email}', is_active={self.is_active})>"
+        return _user_repr(*_user_repr_get(self))
     
-    def to_dict(self):
-        """Convert User object to dictionary"""
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-# Database configuration and session management
-def get_db_engine(database_url: str):
-    """
-    Create and return SQLAlchemy engine
+    def set_password(self, password: str) -> None:
+        """Hash password with Argon2id and store it on the user"""
+        self.hashed_password = _password_hasher.hash(password)
     
-    Args:
-        database_url: Database connection URL (e.g., 'sqlite:///./test.db')
+    def check_password(self, password: str) -> bool:
+        """Verify password against the stored Argon2 hash"""
+        if not self.hashed_password:
+            return False
+        try:
+            return _password_hasher.verify(self.hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            # Wrong password, or stored value is not a valid Argon2 hash
+            return False
     
-    Returns:
-        SQLAlchemy Engine object
-    """
-    return create_engine(database_url, connect_args={"check_same_thread": False} if "sqlite" in database_url else {})
+    def to_dict(self):
+        """
+        Convert User object to dictionary
+        
+        Timestamps are ISO 8601 strings so the result is json.dumps()-safe;
+        for bulk serialization use dto.users_to_builtins.
+        """
+        values = _user_get(self)
+        data = dict(zip(_USER_KEYS, values))
+        created_at, updated_at = values[-2:]
+        data["created_at"] = created_at.isoformat() if created_at else None
+        data["updated_at"] = updated_at.isoformat() if updated_at else None
+        return data
+
 
+# Columns read by the list helpers (everything to_dict exposes)
+_USER_COLUMNS = tuple(getattr(User, key) for key in _USER_KEYS)
 
-def get_db_session(engine):
+
+def list_users_fast(db: Session) -> Sequence[Row]:
     """
-    Create and return database session factory
+    Fetch all users as lightweight Row tuples
+    
+    Skips ORM instance construction and identity-map tracking; use
+    row._mapping (or row._asdict()) to get a dict with the to_dict keys.
     
     Args:
-        engine: SQLAlchemy Engine object
+        db: SQLAlchemy database session
     
     Returns:
-        SessionLocal: Session factory for database operations
+        Sequence of Row objects with the to_dict columns
     """
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return db.execute(select(*_USER_COLUMNS)).all()
 
 
-def init_db(engine):
+def list_users(db: Session) -> Sequence[User]:
     """
-    Initialize database by creating all tables
+    Fetch all users as ORM entities, loading only the to_dict columns
+    
+    hashed_password is deferred and only loaded if accessed.
     
     Args:
-        engine: SQLAlchemy Engine object
+        db: SQLAlchemy database session
+    
+    Returns:
+        Sequence of User objects
     """
-    Base.metadata.create_all(bind=engine)
-
+    return db.scalars(select(User).options(load_only(*_USER_COLUMNS))).all()
 
-# Example usage for testing
-if __name__ == "__main__":
-    # This is just an example of how to use the models
-    # In production, you should use a proper configuration file
-    
-    DATABASE_URL = "sqlite:///./auth.db"
-    
-    # Create engine and session
-    engine = get_db_engine(DATABASE_URL)
-    SessionLocal = get_db_session(engine)
-    
-    # Initialize database
-    init_db(engine)
-    
-    print("Database initialized successfully!")
-    print("User model is ready for use.")
@@ -0,0 +1,64 @@
+"""
+Database Reset Script
+
+Drops all tables and recreates them from the current models.
+WARNING: This is destructive and will remove all data!
+Only runs when settings.debug is enabled (development/testing environments)
+and the reset is confirmed, either by typing "reset" or passing --yes.
+
+Usage (from the project root):
+    python -m scripts.reset_db [--yes]
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from config import settings
+from database import Base, engine, init_db
+
+# Text the user must type to confirm an interactive reset
+CONFIRMATION_WORD = "reset"
+
+
+def drop_db() -> None:
+    """
+    Drop all tables from the database.
+    """
+    import models  # noqa: F401  (registers model tables on Base.metadata)
+
+    Base.metadata.drop_all(bind=engine)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Reset the database if running in debug mode and confirmed."""
+    parser = argparse.ArgumentParser(description="Drop and recreate all database tables.")
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="skip the interactive confirmation prompt",
+    )
+    args = parser.parse_args(argv)
+
+    if not settings.debug:
+        print("Refusing to reset the database: DEBUG is disabled.", file=sys.stderr)
+        return 1
+
+    if not args.yes:
+        answer = input(
+            f"This will delete ALL data in {settings.database_url}.\n"
+            f"Type '{CONFIRMATION_WORD}' to continue: "
+        )
+        if answer.strip() != CONFIRMATION_WORD:
+            print("Aborted: database was not reset.", file=sys.stderr)
+            return 1
+
+    drop_db()
+    init_db()
+    print("Database reset successfully!")
+    print(f"Database URL: {settings.database_url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
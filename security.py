@@ -0,0 +1,53 @@
+"""
+Password Policy Validation
+
+This module checks passwords against the policy configured in Settings
+(password_min_length and the password_require_* flags).
+"""
+
+import re
+
+from config import Settings, get_settings
+
+
+def build_password_pattern(settings: Settings) -> re.Pattern:
+    """
+    Compile the password policy into a single regular expression.
+
+    Each enabled rule becomes a lookahead, so one match checks all of them.
+    Character classes are ASCII: uppercase means A-Z, a number means 0-9,
+    and a special character is anything else that is not an ASCII letter or
+    digit (so non-ASCII letters such as "é" count as special characters).
+    Length is counted in characters; the Argon2 hasher imposes no maximum.
+
+    Args:
+        settings: Settings object holding the password policy
+
+    Returns:
+        re.Pattern: Compiled pattern matching policy-compliant passwords
+    """
+    pattern = rf"(?=.{{{settings.password_min_length},}})"
+    if settings.password_require_uppercase:
+        pattern += r"(?=.*[A-Z])"
+    if settings.password_require_numbers:
+        pattern += r"(?=.*[0-9])"
+    if settings.password_require_special_chars:
+        pattern += r"(?=.*[^A-Za-z0-9])"
+    return re.compile(pattern, re.DOTALL | re.ASCII)
+
+
+# Compiled once at import from the cached settings
+_PASSWORD_RE = build_password_pattern(get_settings())
+
+
+def validate_password(password: str) -> bool:
+    """
+    Check whether a password satisfies the configured password policy.
+
+    Args:
+        password: Plain text password to check
+
+    Returns:
+        bool: True if the password meets every enabled rule
+    """
+    return _PASSWORD_RE.match(password) is not None
@@ -0,0 +1,26 @@
+"""
+Pytest configuration: make the project modules importable and point the
+shared engine at an in-memory SQLite database before they are imported.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def db():
+    """Session on a freshly created schema, dropped again after the test."""
+    from database import Base, SessionLocal, engine, init_db
+
+    init_db()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,157 @@
+"""
+Tests for engine configuration in database.py
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import QueuePool, StaticPool
+
+import database
+from database import (
+    PING_INTERVAL_SECONDS,
+    Base,
+    _async_url,
+    _engine_kwargs,
+    _make_ping_listener,
+    _register_engine_events,
+    get_async_db,
+    get_async_engine,
+    init_async_db,
+)
+from models import User
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ("sqlite+pysqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ("sqlite+aiosqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ("postgresql://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+    ("postgresql+psycopg2://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+    ("postgresql+psycopg://u:p@h/db", "postgresql+psycopg://u:p@h/db"),
+    ("mysql+aiomysql://u:p@h/db", "mysql+aiomysql://u:p@h/db"),
+])
+def test_async_url_uses_async_driver(url, expected):
+    assert _async_url(url) == expected
+
+
+@pytest.mark.parametrize("url", ["mysql://u:p@h/db", "mysql+pymysql://u:p@h/db"])
+def test_async_url_rejects_backend_without_known_async_driver(url):
+    with pytest.raises(ValueError, match="async driver"):
+        _async_url(url)
+
+
+def test_get_async_db_round_trip():
+    async def run():
+        await init_async_db()
+        try:
+            async for db in get_async_db():
+                db.add(User(username="async", email="async@example.com", hashed_password="x"))
+                await db.commit()
+            async for db in get_async_db():
+                user = (await db.execute(select(User))).scalar_one()
+                assert user.username == "async"
+                assert user.created_at is not None
+        finally:
+            async with get_async_engine().begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await get_async_engine().dispose()
+
+    asyncio.run(run())
+
+
+class _FakeDBAPIError(Exception):
+    pass
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, statement):
+        self.connection.pings += 1
+        if self.connection.error is not None:
+            raise self.connection.error
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, error=None):
+        self.pings = 0
+        self.error = error
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+class _FakeRecord:
+    def __init__(self):
+        self.info = {}
+
+
+def test_ping_listener_pings_once_per_interval(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(database.time, "monotonic", lambda: clock[0])
+    ping = _make_ping_listener(_FakeDBAPIError)
+    connection, record = _FakeConnection(), _FakeRecord()
+
+    ping(connection, record, None)
+    clock[0] += PING_INTERVAL_SECONDS / 2
+    ping(connection, record, None)
+    assert connection.pings == 1
+
+    clock[0] += PING_INTERVAL_SECONDS
+    ping(connection, record, None)
+    assert connection.pings == 2
+
+
+def test_ping_listener_raises_disconnection_error_on_dbapi_error():
+    ping = _make_ping_listener(_FakeDBAPIError)
+    connection, record = _FakeConnection(_FakeDBAPIError("gone")), _FakeRecord()
+    with pytest.raises(DisconnectionError):
+        ping(connection, record, None)
+    assert "last_ping" not in record.info
+
+
+def test_ping_listener_propagates_other_errors():
+    ping = _make_ping_listener(_FakeDBAPIError)
+    connection = _FakeConnection(TypeError("bug"))
+    with pytest.raises(TypeError):
+        ping(connection, _FakeRecord(), None)
+
+
+@pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"])
+def test_engine_kwargs_in_memory_sqlite_uses_static_pool(url):
+    kwargs = _engine_kwargs(url)
+    assert kwargs["poolclass"] is StaticPool
+    assert kwargs["connect_args"] == {"check_same_thread": False}
+    assert "pool_size" not in kwargs
+
+
+def test_engine_kwargs_file_sqlite_uses_small_queue_pool():
+    kwargs = _engine_kwargs("sqlite:///./app.db")
+    assert kwargs["pool_size"] == 5
+    assert "poolclass" not in kwargs
+
+
+def test_engine_kwargs_server_database():
+    kwargs = _engine_kwargs("postgresql+asyncpg://u:p@h/db")
+    assert kwargs == {"pool_size": 20, "max_overflow": 10, "pool_recycle": 1800}
+
+
+def test_file_sqlite_engine_applies_pragmas(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(url, **_engine_kwargs(url))
+    _register_engine_events(engine)
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+    finally:
+        engine.dispose()
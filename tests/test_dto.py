@@ -0,0 +1,32 @@
+"""
+Tests for the msgspec serialization DTOs
+"""
+
+from dto import UserDTO, user_to_dto, users_to_builtins
+from models import User, list_users, list_users_fast
+
+
+def _add_user(db):
+    db.add(User(username="dave", email="dave@example.com", hashed_password="x"))
+    db.commit()
+    db.expunge_all()
+
+
+def test_user_to_dto_from_entity(db):
+    _add_user(db)
+    dto = user_to_dto(list_users(db)[0])
+    assert isinstance(dto, UserDTO)
+    assert dto.username == "dave"
+
+
+def test_users_to_builtins_gives_iso_timestamps_for_rows_and_entities(db):
+    _add_user(db)
+    from_rows = users_to_builtins(list_users_fast(db))
+    from_entities = users_to_builtins(list_users(db))
+    assert from_rows == from_entities
+    data = from_rows[0]
+    assert set(data) == set(UserDTO.__struct_fields__)
+    assert data["username"] == "dave"
+    assert isinstance(data["created_at"], str)
+    assert data["created_at"] == list_users(db)[0].created_at.isoformat()
+    assert isinstance(data["updated_at"], str)
@@ -0,0 +1,91 @@
+"""
+Tests for the User model
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect
+
+from models import _USER_KEYS, User, list_users, list_users_fast
+
+
+def test_password_round_trip():
+    user = User()
+    user.set_password("Secr3t!pass")
+    assert user.check_password("Secr3t!pass")
+    assert not user.check_password("wrong")
+
+
+def test_password_longer_than_72_bytes_round_trips():
+    password = "Aa1!" + "x" * 70
+    assert len(password.encode("utf-8")) > 72
+    user = User()
+    user.set_password(password)
+    assert user.check_password(password)
+    # A bcrypt-style 72-byte truncation must not verify
+    assert not user.check_password(password[:72])
+
+
+def test_multibyte_password_round_trips():
+    password = "\U0001F512" * 19
+    user = User()
+    user.set_password(password)
+    assert user.check_password(password)
+
+
+def test_check_password_rejects_invalid_stored_hash():
+    user = User(hashed_password="not-a-hash")
+    assert not user.check_password("anything")
+
+
+def test_to_dict_is_json_serializable(db):
+    user = User(username="alice", email="alice@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    data = json.loads(json.dumps(user.to_dict()))
+    assert data["username"] == "alice"
+    assert data["created_at"] == user.created_at.isoformat()
+
+
+def test_timestamps_are_set_on_insert_and_refreshed_on_update(db):
+    before = datetime.utcnow() - timedelta(seconds=1)
+    user = User(username="bob", email="bob@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    assert before <= user.created_at <= datetime.utcnow() + timedelta(seconds=1)
+    assert user.updated_at == user.created_at
+    created_at = user.created_at
+
+    time.sleep(0.01)
+    user.email = "bob@example.org"
+    db.commit()
+    assert user.created_at == created_at
+    assert user.updated_at > created_at
+
+
+def _add_user(db):
+    user = User(username="carol", email="carol@example.com")
+    user.set_password("Secr3t!pass")
+    db.add(user)
+    db.commit()
+    db.expunge_all()
+
+
+def test_list_users_fast_returns_to_dict_columns(db):
+    _add_user(db)
+    rows = list_users_fast(db)
+    assert len(rows) == 1
+    assert tuple(rows[0]._mapping.keys()) == _USER_KEYS
+    assert rows[0].username == "carol"
+
+
+def test_list_users_defers_hashed_password(db):
+    _add_user(db)
+    users = list_users(db)
+    assert len(users) == 1
+    state = inspect(users[0])
+    assert "hashed_password" in state.unloaded
+    assert not set(_USER_KEYS) & state.unloaded
+    assert users[0].to_dict()["username"] == "carol"
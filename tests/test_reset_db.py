@@ -0,0 +1,44 @@
+"""
+Tests for the database reset script
+"""
+
+from config import Settings
+from models import User
+from scripts import reset_db
+
+
+def _add_user(db):
+    db.add(User(username="erin", email="erin@example.com", hashed_password="x"))
+    db.commit()
+
+
+def test_reset_aborts_without_confirmation(db, monkeypatch):
+    _add_user(db)
+    monkeypatch.setattr("builtins.input", lambda prompt: "no")
+    assert reset_db.main([]) == 1
+    assert db.query(User).count() == 1
+
+
+def test_reset_runs_with_typed_confirmation(db, monkeypatch):
+    _add_user(db)
+    monkeypatch.setattr("builtins.input", lambda prompt: reset_db.CONFIRMATION_WORD)
+    assert reset_db.main([]) == 0
+    assert db.query(User).count() == 0
+
+
+def test_reset_runs_with_yes_flag(db, monkeypatch):
+    _add_user(db)
+
+    def fail(prompt):
+        raise AssertionError("prompted despite --yes")
+
+    monkeypatch.setattr("builtins.input", fail)
+    assert reset_db.main(["--yes"]) == 0
+    assert db.query(User).count() == 0
+
+
+def test_reset_refuses_when_debug_disabled(db, monkeypatch):
+    _add_user(db)
+    monkeypatch.setattr(reset_db, "settings", Settings(debug=False))
+    assert reset_db.main(["--yes"]) == 1
+    assert db.query(User).count() == 1
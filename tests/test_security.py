@@ -0,0 +1,52 @@
+"""
+Tests for password policy validation
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from config import Settings
+from security import build_password_pattern, validate_password
+
+
+def test_validate_password_default_policy():
+    assert validate_password("Abcdef1!")
+    assert not validate_password("abcdef1!")  # no uppercase
+    assert not validate_password("Abcdefg!")  # no number
+    assert not validate_password("Abcdefg1")  # no special character
+    assert not validate_password("Ab1!")  # too short
+
+
+def test_long_password_is_accepted():
+    assert validate_password("Aa1!" + "x" * 100)
+
+
+def test_character_classes_are_ascii():
+    # A non-ASCII digit does not satisfy the number rule
+    assert not validate_password("Abcdef١!")
+    # A non-ASCII letter counts as a special character
+    assert validate_password("Abcdef1é")
+
+
+def test_disabled_rules_are_not_enforced():
+    pattern = build_password_pattern(Settings(
+        password_min_length=4,
+        password_require_uppercase=False,
+        password_require_numbers=False,
+        password_require_special_chars=False,
+    ))
+    assert pattern.match("abcd")
+    assert not pattern.match("abc")
+
+
+def test_min_length_boundary():
+    pattern = build_password_pattern(Settings(password_min_length=0))
+    assert pattern.match("A1!")
+    pattern = build_password_pattern(Settings(password_min_length=3))
+    assert pattern.match("A1!")
+    assert not pattern.match("A1")
+
+
+def test_negative_min_length_is_rejected():
+    with pytest.raises(ValidationError):
+        Settings(password_min_length=-1)